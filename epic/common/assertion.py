@@ -1,6 +1,6 @@
 import inspect
+import functools
 from types import UnionType
-from decorator import decorator
 from collections.abc import Callable
 from typing import TypeVar, TypeAlias
 
@@ -33,7 +33,14 @@ def assert_type(obj, type_or_types: TypeOrTypes, name: str | None = None) -> Non
     ------
     TypeError
         If the object is not of one of the types.
+
+    Notes
+    -----
+    Like the builtin `assert` statement, this check is skipped entirely when Python
+    runs in optimized mode (`-O` / PYTHONOPTIMIZE).
     """
+    if not __debug__:
+        return
     if not isinstance(obj, type_or_types):
         if isinstance(type_or_types, UnionType):
             type_or_types = tuple(type(t) if t is None else t for t in type_or_types.__args__)
@@ -58,6 +65,10 @@ def assert_types(**expected_types: TypeOrTypes) -> Callable[[C], C]:
     If any of them isn't, raises a TypeError.
     Otherwise, runs the function normally.
 
+    The function's signature is inspected once, when the decorator is applied, and argument
+    names are validated against it at that point. Arguments which are not provided in a call
+    (i.e. take their default values) are not asserted.
+
     Parameters
     ----------
     **expected_types : type, tuple of types or UnionType
@@ -69,6 +80,17 @@ def assert_types(**expected_types: TypeOrTypes) -> Callable[[C], C]:
     decorator
         A signature-preserving decorator.
 
+    Raises
+    ------
+    ValueError
+        When the decorator is applied to a function missing any of the asserted argument names.
+
+    Notes
+    -----
+    Like the builtin `assert` statement, the checks are skipped entirely when Python
+    runs in optimized mode (`-O` / PYTHONOPTIMIZE): the decorated function is returned
+    unchanged, so there is no wrapper overhead at all.
+
     Examples
     --------
     >>> @assert_types(x=int, y=float | None)
@@ -76,11 +98,53 @@ def assert_types(**expected_types: TypeOrTypes) -> Callable[[C], C]:
     ...   # can safely assume `x` is an int and `y` is either a float or None
     ...   ...
     """
-    def type_asserter(func, *args, **kwargs):
-        call_args = inspect.signature(func).bind(*args, **kwargs).arguments
-        for name, expected_type in expected_types.items():
-            if name not in call_args:
-                raise ValueError(f"Can't assert type of '{name}': no such argument in function.")
-            assert_type(call_args[name], expected_type, name)
-        return func(*args, **kwargs)
-    return decorator(type_asserter)
+    if not __debug__:
+        return lambda func: func
+
+    # Pre-unpack unions into plain tuples of types: isinstance against a tuple is faster
+    # than against a UnionType, which routes through __instancecheck__ on every call.
+    expected_types = {
+        name: tuple(type(t) if t is None else t for t in expected.__args__)
+        if isinstance(expected, UnionType) else expected
+        for name, expected in expected_types.items()
+    }
+
+    def type_asserter(func: C) -> C:
+        sig = inspect.signature(func)
+        if unknown := set(expected_types) - set(sig.parameters):
+            raise ValueError(f"Can't assert type of {sorted(unknown)}: no such arguments in function.")
+        name_and_type = tuple(expected_types.items())
+
+        # When the function takes no *args/**kwargs, arguments can be located directly from the
+        # code object: positionally by index, or by name in kwargs. This avoids the (relatively
+        # expensive) sig.bind() call entirely; bind() remains as a fallback for the general case.
+        code = getattr(func, '__code__', None)
+        simple_args = code is not None and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+
+        if simple_args:
+            positions = {name: i for i, name in enumerate(code.co_varnames[:code.co_argcount])}
+            name_index_type = tuple(
+                (name, positions.get(name), expected_type) for name, expected_type in name_and_type
+            )
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                for name, index, expected_type in name_index_type:
+                    if index is not None and index < len(args):
+                        assert_type(args[index], expected_type, name)
+                    elif name in kwargs:
+                        assert_type(kwargs[name], expected_type, name)
+                return func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                call_args = sig.bind(*args, **kwargs).arguments
+                for name, expected_type in name_and_type:
+                    if name in call_args:
+                        assert_type(call_args[name], expected_type, name)
+                return func(*args, **kwargs)
+        # functools.wraps only copies `__wrapped__`; expose the true signature directly
+        # so introspection tools don't need to walk the wrapper chain.
+        wrapper.__signature__ = sig
+        return wrapper
+    return type_asserter
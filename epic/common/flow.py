@@ -1,5 +1,6 @@
 import copy
 import functools
+import threading
 
 
 def check(predicate, message_or_exception_instance="check failed"):
@@ -16,13 +17,21 @@ def check(predicate, message_or_exception_instance="check failed"):
 
 def pragma_once(f):
     """
-    Decorate a function so that it runs normally when first called, but immediately returns None on any subsequent call
+    Decorate a function so that it runs normally when first called, but immediately returns None on any subsequent call.
+    Safe for concurrent use: even if first called from several threads at once, the function only runs once.
     """
+    done = False
+    lock = threading.Lock()
+
     @functools.wraps(f)
     def _f(*args, **kwargs):
-        if hasattr(f, "__pragma_once__"):
+        nonlocal done
+        if done:
             return
-        setattr(f, "__pragma_once__", True)
+        with lock:
+            if done:
+                return
+            done = True
         return f(*args, **kwargs)
     return _f
 
@@ -30,7 +39,11 @@ def pragma_once(f):
 def clone_and_apply(f):
     """
     Decorator to replace a self-modifying method with a clone-self-and-return-modified method.
-    Cloning is done by the instance's `clone()` method, or copy.deepcopy(self) as fallback.
+    Cloning is done by the instance's `clone()` method, or by `copy.copy(self)` if the class
+    defines `__copy__`, or copy.deepcopy(self) as a last resort.
+
+    Note that `deepcopy` walks the entire object graph and can be very slow for large objects;
+    classes used with this decorator are encouraged to provide a `clone()` method or `__copy__`.
 
     Examples
     --------
@@ -56,6 +69,8 @@ def clone_and_apply(f):
     def _f(self, *args, **kwargs):
         if hasattr(self, "clone"):
             clone = self.clone()
+        elif hasattr(type(self), "__copy__"):
+            clone = copy.copy(self)
         else:
             clone = copy.deepcopy(self)
         f(clone, *args, **kwargs)
@@ -1,12 +1,18 @@
 import math
+import bisect
+import hashlib
 import logging
 import numbers
 import functools
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 from io import IOBase
 from types import MappingProxyType
-from collections import defaultdict
-from collections.abc import Iterable, Callable, Hashable, Mapping
+from collections.abc import Iterable, Callable, Hashable, Mapping, Sequence, Sized
 from typing import TypeVar, TypeGuard, Generic, ParamSpec, Concatenate, overload, cast
 
 B = TypeVar('B', bound=bytes | bytearray)
@@ -24,10 +30,16 @@ __all__ = [
 ]
 
 
+# Concrete types checked by exact type before falling back to the (much slower) ABC checks
+_COMMON_ITERABLE_TYPES = (list, tuple, set, frozenset, dict)
+
+
 def is_iterable(obj) -> TypeGuard[Iterable]:
     """
     Test whether an object is iterable, but NOT a string or a bytes instance.
     """
+    if type(obj) in _COMMON_ITERABLE_TYPES:
+        return True
     return isinstance(obj, Iterable) and not isinstance(obj, str | bytes | bytearray)
 
 
@@ -38,7 +50,10 @@ def to_iterable(obj: T | Iterable[T]) -> Iterable[T]:
     Strings, bytes, bytearrays and Mappings are treated as single objects. For those types of
     inputs, a tuple of length 1 is returned.
     """
-    # Mappings need special handling since iterating over them means only iterating over the keys
+    tp = type(obj)
+    if tp in _COMMON_ITERABLE_TYPES:
+        # Mappings need special handling since iterating over them means only iterating over the keys
+        return (obj,) if tp is dict else obj
     if is_iterable(obj) and not isinstance(obj, Mapping):
         return obj
     return cast(T, obj),
@@ -67,13 +82,16 @@ def to_bytes(obj, encoding='utf-8', errors='replace'):
     """
     Convert an object to a byte sequence - either a bytes or a bytearray.
     """
+    if isinstance(obj, str):
+        # For ASCII-only strings, utf-8 and ascii encodings coincide, but the ascii codec is faster
+        if encoding == 'utf-8' and obj.isascii():
+            return obj.encode('ascii')
+        return obj.encode(encoding, errors=errors)
     if isinstance(obj, bytes | bytearray):
         return obj
     if isinstance(obj, memoryview):
         return obj.tobytes()
-    if not isinstance(obj, str):
-        obj = str(obj)
-    return obj.encode(encoding, errors=errors)
+    return str(obj).encode(encoding, errors=errors)
 
 
 @overload
@@ -119,20 +137,30 @@ class classproperty(Generic[C_contra, T_co]):
         return self.func(owner_cls)
 
 
-def indexer_dict() -> defaultdict[Hashable, int]:
+class _IndexerDict(dict):
+    __slots__ = ()
+
+    def __missing__(self, key):
+        value = self[key] = len(self)
+        return value
+
+
+def indexer_dict() -> dict[Hashable, int]:
     """
-    Create and return a new `collections.defaultdict` which assigns to new keys the current number of elements.
+    Create and return a new dict which assigns to new keys the current number of elements.
 
     In essence, it gives a collection of items the unique indices `{0, ..., n-1}`, where `n` is the
     number of unique items.
 
     Returns
     -------
-    collections.defaultdict
+    dict
     """
-    dd = defaultdict[Hashable, int]()
-    dd.default_factory = dd.__len__
-    return dd
+    return _IndexerDict()
+
+
+# logging.getLoggerClass acquires the logging lock; look it up once instead of per hashed node
+_LOGGER_CLASS = logging.getLoggerClass()
 
 
 def hash_content(obj) -> int:
@@ -141,8 +169,10 @@ def hash_content(obj) -> int:
 
     For hashable objects, returns their built-in hash.
     For other objects, attempts to obtain a "representation" of the object's content,
-    either its state (using `__getstate__`), its `__dict__` or its items, and hash them recursively,
+    either its state (using `__getstate__`), its `__dict__` or its items, and hash them,
     together with information about the object's type.
+    The traversal is iterative, streaming all content into a single hasher, so arbitrarily
+    deep structures are handled without recursion or intermediate containers.
     That means that for mutable objects, multiple calls to `hash_content` may not return the same value.
 
     Parameters
@@ -160,28 +190,92 @@ def hash_content(obj) -> int:
             return hash(obj)
         except TypeError:
             pass
-    typename = type(obj).__name__
-    if hasattr(obj, '__getstate__') and (state := obj.__getstate__()) is not None:
-        obj = state
-    elif isinstance(obj, logging.getLoggerClass()):
-        obj = obj.name
-    elif hasattr(obj, '__dict__'):
-        if isinstance(obj.__dict__, MappingProxyType):
-            objdict = {k: v for k, v in obj.__dict__.items() if not k.startswith('__')}
+    # xxhash is considerably faster, when available
+    hasher = hashlib.blake2b(digest_size=8) if xxhash is None else xxhash.xxh3_64()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Hashable):
+            try:
+                hasher.update(hash(item).to_bytes(8, 'little', signed=True))
+                continue
+            except TypeError:
+                pass
+        typename = type(item).__name__
+        if hasattr(item, '__getstate__') and (state := item.__getstate__()) is not None:
+            item = state
+        elif isinstance(item, _LOGGER_CLASS):
+            item = item.name
+        elif hasattr(item, '__dict__'):
+            if isinstance(item.__dict__, MappingProxyType):
+                objdict = {k: v for k, v in item.__dict__.items() if not k.startswith('__')}
+            else:
+                objdict = item.__dict__.copy()
+            objdict['___name'] = getattr(item, '__name__', None)
+            objdict['___classname'] = typename
+            if isinstance(item, dict):
+                item = item.copy()
+                item['___objdict'] = objdict
+            else:
+                item = objdict
+        if isinstance(item, Mapping):
+            # Sort the keys by their repr, for a stable traversal order
+            hasher.update(f'{typename}\x00map{len(item)}'.encode())
+            for key, value in sorted(item.items(), key=lambda kv: repr(kv[0]), reverse=True):
+                stack.append(value)
+                stack.append(key)
+        elif is_iterable(item) and not isinstance(item, IOBase):
+            items = tuple(item)
+            hasher.update(f'{typename}\x00seq{len(items)}'.encode())
+            stack.extend(reversed(items))
         else:
-            objdict = obj.__dict__.copy()
-        objdict['___name'] = getattr(obj, '__name__', None)
-        objdict['___classname'] = typename
-        if isinstance(obj, dict):
-            obj = obj.copy()
-            obj['___objdict'] = objdict
+            # The normalized object may have become hashable; if it is still not, this
+            # raises a TypeError, just like hashing the original object would.
+            hasher.update(f'{typename}\x00'.encode())
+            hasher.update(hash(item).to_bytes(8, 'little', signed=True))
+    if xxhash is None:
+        return int.from_bytes(hasher.digest(), 'little')
+    return hasher.intdigest()
+
+
+# Scale thresholds, from the smallest supported prefix (index 0) to the largest.
+# A number's scale is its insertion position in the table, offset so that scale 0 means no prefix.
+_SCALE_OFFSET = 11
+_SI_THRESHOLDS = tuple(1000 ** k for k in range(1 - _SCALE_OFFSET, _SCALE_OFFSET))
+_BINARY_THRESHOLDS = tuple(1024 ** k for k in range(1 - _SCALE_OFFSET, _SCALE_OFFSET))
+
+
+def _scale_and_digits(number: float, binary: bool) -> tuple[float, int, int]:
+    """
+    Find the scale of a positive number, the number scaled accordingly,
+    and its number of digits before the decimal point.
+    """
+    thresholds, base = (_BINARY_THRESHOLDS, 1024) if binary else (_SI_THRESHOLDS, 1000)
+    # The scale is simply the number's position in the (sorted) threshold table.
+    # This avoids math.log calls, whose inaccuracy can also cause rounding errors.
+    scale = bisect.bisect_right(thresholds, number) - _SCALE_OFFSET
+    scaled_number = number / base ** scale
+    return scaled_number, scale, len(str(int(scaled_number)))
+
+
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    # When numba is available, a JIT-compiled version pays off for bulk formatting.
+    # It uses math.log instead of the table lookup, as compiled code cannot use bisect or str.
+    @njit(cache=True)
+    def _scale_and_digits(number: float, binary: bool) -> tuple[float, int, int]:
+        if binary:
+            scale = int(math.log2(number) // 10)
+            base = 1024.0
         else:
-            obj = objdict
-    if isinstance(obj, Mapping):
-        obj = frozenset((k, hash_content(v)) for k, v in obj.items())
-    elif is_iterable(obj) and not isinstance(obj, IOBase):
-        obj = tuple(map(hash_content, obj))
-    return hash((obj, typename))
+            scale = int(math.log10(number) // 3)
+            base = 1000.0
+        scale = min(_SCALE_OFFSET - 1, max(1 - _SCALE_OFFSET, scale))
+        scaled_number = number / base ** scale
+        return scaled_number, scale, int(math.log10(scaled_number)) + 1
 
 
 def human_readable(number: float, binary: bool = False, n_digits: int = 2) -> str:
@@ -212,15 +306,10 @@ def human_readable(number: float, binary: bool = False, n_digits: int = 2) -> st
         number = -number
     else:
         return '0'
-    # The generic math.log with base 2/10 gives less accurate results, which can cause rounding errors.
-    log, exponent, base, kilo, units_suffix = (
-        math.log2, 10, 1024, 'K', 'i',
-    ) if binary else (
-        math.log10, 3, 1000, 'k', '',
-    )
-    scale = int(log(number) // exponent)
-    scaled_number = number / base ** scale
-    precision = int(math.log10(scaled_number)) + n_digits + 1  # log10 because, still, digits...
+    kilo, units_suffix = ('K', 'i') if binary else ('k', '')
+    # Passed as a float, so the numba variant doesn't coerce ints >= 2**63 to int64
+    scaled_number, scale, int_digits = _scale_and_digits(float(number), binary)
+    precision = int_digits + n_digits  # number of digits before the point, plus `n_digits` after
     if scale > 0:
         units = f" {(kilo + 'MGTPEZYRQ')[scale - 1]}{units_suffix}"
     elif scale < 0:
@@ -250,6 +339,15 @@ def get_single(items: Iterable[T]) -> T:
     ValueError
         If `items` contain more or fewer than a single item.
     """
+    # For sized containers, checking the length is much cheaper than two iterator steps
+    if isinstance(items, Sized):
+        if len(items) != 1:
+            if not items:
+                raise ValueError("Cannot get single value; no values found")
+            raise ValueError(f"Cannot get single value; more than one value found: {items!r}")
+        if isinstance(items, Sequence):
+            return items[0]
+        return next(iter(items))
     it = iter(items)
     try:
         item = next(it)
@@ -276,6 +374,8 @@ def coalesce(*args: T) -> T | None:
     """
     Return the first argument that is not None, or None if no such argument was provided.
     """
-    for arg in args:
-        if arg is not None:
-            return arg
+    # Two arguments is by far the common case; worth a dedicated branch
+    if len(args) == 2:
+        first, second = args
+        return first if first is not None else second
+    return next((arg for arg in args if arg is not None), None)
@@ -1,3 +1,5 @@
+import sys
+import functools
 import importlib
 
 from typing import TypeGuard
@@ -11,6 +13,7 @@ def is_lambda_function(obj) -> TypeGuard[LambdaType]:
     return isinstance(obj, LambdaType) and obj.__name__ == "<lambda>"
 
 
+@functools.cache
 def fullname2obj(name: str):
     """
     Convert a dotted string name into an imported object.
@@ -42,6 +45,13 @@ def fullname2obj(name: str):
     AttributeError
         If the object could not be found in the module.
 
+    Notes
+    -----
+    For any given name, the result never changes within a running process, so results are
+    memoized: repeated lookups of the same name are a single dict access.
+    Should a module become importable only after a failed lookup (a rare case), the cache
+    can be reset via ``fullname2obj.cache_clear()``.
+
     See Also
     --------
     fullname : Inverse function.
@@ -52,8 +62,10 @@ def fullname2obj(name: str):
     module = None
     tokens = name.split(".")
     for i in range(len(tokens)):
+        prefix = ".".join(tokens[:i+1])
         try:
-            module = importlib.import_module(".".join(tokens[:i+1]))
+            # Already-imported modules are resolved directly, skipping the finder machinery
+            module = sys.modules.get(prefix) or importlib.import_module(prefix)
         except ModuleNotFoundError:
             if i == 0:
                 raise
@@ -1,19 +1,31 @@
+import io
 import os
+import re
 import json
+import math
 import pickle
 import tempfile
 import warnings
 
 from collections.abc import Iterable
-from contextlib import contextmanager
 
 from .pathgeneralizer import GeneralizedPath, PathGeneralizer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = [
     'pload', 'pdump', 'readf', 'writef', 'execfile', 'iterlines',
     'jload', 'jdump', 'with_temp_file',
 ]
 
+_PICKLE_BUFFER_SIZE = 1 << 20
+
+# 2**63 has 19 digits, so any number this long might not survive orjson parsing
+_LONG_INTEGER_REGEX = re.compile(rb"\d{19}")
+
 
 def pload(filename: GeneralizedPath, fix_imports: bool = True, encoding: str = "ASCII", errors: str = "strict"):
     """
@@ -36,6 +48,10 @@ def pload(filename: GeneralizedPath, fix_imports: bool = True, encoding: str = "
         Loaded object.
     """
     with PathGeneralizer.from_path(filename).open("rb") as f:
+        # The unpickler issues many small reads; a large buffer amortizes syscalls
+        # (or range-reads, for remote paths)
+        if not isinstance(f, io.BufferedReader):
+            f = io.BufferedReader(f, buffer_size=_PICKLE_BUFFER_SIZE)
         return pickle.load(f, fix_imports=fix_imports, encoding=encoding, errors=errors)
 
 
@@ -64,7 +80,12 @@ def pdump(data, filename: GeneralizedPath, protocol: int = pickle.HIGHEST_PROTOC
     None
     """
     with PathGeneralizer.from_path(filename).open("wb") as f:
-        pickle.dump(data, f, protocol=protocol, fix_imports=fix_imports)
+        if isinstance(f, io.BufferedWriter):
+            pickle.dump(data, f, protocol=protocol, fix_imports=fix_imports)
+        else:
+            buffered = io.BufferedWriter(f, buffer_size=_PICKLE_BUFFER_SIZE)
+            pickle.dump(data, buffered, protocol=protocol, fix_imports=fix_imports)
+            buffered.flush()
 
 
 def readf(filename: GeneralizedPath, size: int = -1) -> bytes:
@@ -139,7 +160,7 @@ def execfile(filename: GeneralizedPath, global_vars: dict | None = None, local_v
     exec(compiled_code, global_vars, local_vars)
 
 
-def iterlines(filename: GeneralizedPath, ignore_comments: bool = True) -> Iterable[str]:
+def iterlines(filename: GeneralizedPath, ignore_comments: bool = True, stream: bool = False) -> Iterable[str]:
     """
     Iterate over lines in a file.
     Leading and trailing whitespaces are stripped.
@@ -154,15 +175,26 @@ def iterlines(filename: GeneralizedPath, ignore_comments: bool = True) -> Iterab
     ignore_comments : bool, default True
         Whether to skip lines beginning with '#'.
 
+    stream : bool, default False
+        Whether to read the file line by line instead of all at once.
+        Reading in bulk and splitting the lines in C is considerably faster,
+        but for files too large to fit in memory, set this to True.
+
     Returns
     -------
     iterator
         Each item is a line from the file, as a string.
     """
-    with PathGeneralizer.from_path(filename).open('r') as f:
-        for line in f:
+    if stream:
+        with PathGeneralizer.from_path(filename).open('r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not (ignore_comments and line.startswith('#')):
+                    yield line
+    else:
+        for line in PathGeneralizer.from_path(filename).read('r').splitlines():
             line = line.strip()
-            if line and not (ignore_comments and line.startswith('#')):
+            if line and not (ignore_comments and line[0] == '#'):
                 yield line
 
 
@@ -178,16 +210,50 @@ def jload(filename: GeneralizedPath, **kwargs):
 
     **kwargs :
         Sent to `json.load`.
+        When `orjson` is installed and no kwargs are given, it is used instead,
+        being significantly faster.
 
     Returns
     -------
     object
         Loaded object.
     """
+    if orjson is not None and not kwargs:
+        with PathGeneralizer.from_path(filename).open("rb") as f:
+            contents = f.read()
+        # orjson silently degrades integers beyond 64 bits to floats, whereas the
+        # stdlib parses them exactly; any long digit run (even a false positive
+        # inside a string) routes the whole file to the stdlib parser
+        if _LONG_INTEGER_REGEX.search(contents) is None:
+            try:
+                return orjson.loads(contents)
+            except orjson.JSONDecodeError:
+                # orjson is also stricter than the stdlib (e.g. rejects NaN/Infinity
+                # tokens, which stdlib json itself writes), so re-parse before giving up
+                pass
+        return json.loads(contents)
     with PathGeneralizer.from_path(filename).open("r") as f:
         return json.load(f, **kwargs)
 
 
+def _contains_nonfinite(obj) -> bool:
+    """
+    Check whether a JSON-serializable object contains NaN or infinite floats anywhere.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple):
+            stack.extend(item)
+    return False
+
+
 def jdump(data, filename: GeneralizedPath, *, indent: int | None = 2, **kwargs) -> None:
     """
     Dump an object to a JSON file.
@@ -206,20 +272,48 @@ def jdump(data, filename: GeneralizedPath, *, indent: int | None = 2, **kwargs)
 
     **kwargs :
         Sent to `json.dump`.
+        When `orjson` is installed, no kwargs are given and `indent` is 2 or None,
+        it is used instead, being significantly faster.
 
     Returns
     -------
     None
+
+    Notes
+    -----
+    orjson natively serializes some types the stdlib rejects (e.g. datetimes,
+    dataclasses, numpy values), so when the fast path is taken, such inputs are
+    written instead of raising a TypeError.
     """
+    if orjson is not None and not kwargs and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+        try:
+            # Serialized before opening the file, so a failure leaves it untouched
+            serialized = orjson.dumps(data, option=option)
+        except (TypeError, orjson.JSONEncodeError):
+            # orjson cannot represent everything the stdlib can
+            # (e.g. integers beyond 64 bits)
+            pass
+        else:
+            # orjson silently turns NaN/Infinity into null, whereas the stdlib writes
+            # round-trippable tokens. Any such value must show up as "null" in the
+            # output, so the precise (and slower) scan runs only when one appears.
+            if b'null' not in serialized or not _contains_nonfinite(data):
+                with PathGeneralizer.from_path(filename).open('wb') as f:
+                    f.write(serialized)
+                    f.write(b'\n')
+                return
     with PathGeneralizer.from_path(filename).open('w') as f:
         json.dump(data, f, indent=indent, **kwargs)
         f.write('\n')
 
 
-@contextmanager
-def with_temp_file(suffix: str = ""):
+# Implemented as a plain class rather than a @contextmanager generator,
+# which is cheaper to enter and exit when many short-lived temp files are created.
+class with_temp_file:
     """
     A context manager yielding a path to a new temporary file, deleting it upon exit.
+    The file is created (empty) upon entry, so the name is reserved atomically.
 
     Parameters
     ----------
@@ -227,12 +321,21 @@ def with_temp_file(suffix: str = ""):
         Suffix for the temporary file.
         A "." is NOT added between the name and the suffix.
     """
-    filename = tempfile.mktemp(suffix=suffix)
-    try:
-        yield filename
-    finally:
-        if os.path.isfile(filename):
+    __slots__ = ('suffix', 'filename')
+
+    def __init__(self, suffix: str = ""):
+        self.suffix = suffix
+
+    def __enter__(self) -> str:
+        # Unlike the insecure tempfile.mktemp, this creates the file with O_EXCL, avoiding races
+        f = tempfile.NamedTemporaryFile(suffix=self.suffix, delete=False)
+        f.close()
+        self.filename = f.name
+        return self.filename
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if os.path.isfile(self.filename):
             try:
-                os.remove(filename)
+                os.remove(self.filename)
             except PermissionError:
-                warnings.warn(f"Temporary file {filename} was not deleted!")
+                warnings.warn(f"Temporary file {self.filename} was not deleted!")
@@ -1,3 +1,4 @@
+import math
 import random
 import functools
 import itertools
@@ -6,6 +7,19 @@ from collections import deque
 from typing import TypeVar, Generic, overload
 from collections.abc import Iterable, Callable, Hashable, Iterator, Sized
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# itertools.batched is only available on Python 3.12+
+_batched = getattr(itertools, 'batched', None)
+
 T = TypeVar('T')
 T_co = TypeVar('T_co', covariant=True)
 S = TypeVar('S')
@@ -20,12 +34,12 @@ __all__ = [
 
 
 @overload
-def unique(items: Iterable[H], key: None = None) -> Iterable[H]: ...
+def unique(items: Iterable[H], key: None = None, *, identity: bool = False) -> Iterable[H]: ...
 @overload
-def unique(items: Iterable[T], key: Callable[[T], Hashable]) -> Iterable[T]: ...
+def unique(items: Iterable[T], key: Callable[[T], Hashable], *, identity: bool = False) -> Iterable[T]: ...
 
 
-def unique(items, key=None):
+def unique(items, key=None, *, identity=False):
     """
     Iterate over unique items, maintaining the order of the elements.
 
@@ -37,23 +51,42 @@ def unique(items, key=None):
     key : callable, optional
         If provided, used to compare items to each other, to determine uniqueness.
 
+    identity : bool, default False
+        If True, items are compared by identity (`id`) rather than by equality.
+        This works for unhashable items as well, and `key` is ignored.
+
     Returns
     -------
     iterator
+
+    Notes
+    -----
+    When `key` is not provided and `identity` is False, deduplication is done entirely
+    in C (via `dict.fromkeys`), which is several times faster but consumes the input eagerly.
     """
+    if identity:
+        return _unique_by_key(items, id)
+    if key is None:
+        return iter(dict.fromkeys(items))
+    return _unique_by_key(items, key)
+
+
+def _unique_by_key(items, key):
     seen = set()
+    seen_add = seen.add
     for item in items:
-        if (x := item if key is None else key(item)) not in seen:
-            seen.add(x)
+        if (x := key(item)) not in seen:
+            seen_add(x)
             yield item
 
 
-def batches(items: Iterable[T], size: int) -> Iterable[Iterable[T]]:
+def batches(items: Iterable[T], size: int, lazy: bool = False) -> Iterable[Iterable[T]]:
     """
     Iterate over items in batches of fixed size.
     The last batch may be smaller.
 
-    Note: Each batch MUST be consumed before the next one is retrieved.
+    Note: Unless `itertools.batched` is available (Python 3.12+) and `lazy` is False,
+    each batch MUST be consumed before the next one is retrieved.
 
     Parameters
     ----------
@@ -63,12 +96,20 @@ def batches(items: Iterable[T], size: int) -> Iterable[Iterable[T]]:
     size : int
         The size of each batch.
 
+    lazy : bool, default False
+        When False and `itertools.batched` is available (Python 3.12+), batches are
+        yielded as materialized tuples, built entirely in C. Set to True to force
+        lazily-generated batches, where at most one batch is held in memory at a time.
+
     See Also
     --------
     batches_lol : Split the items into batches and return a list of lists.
     """
     if size <= 0:
         raise ValueError(f"`size` must be positive; got {size}.")
+    if _batched is not None and not lazy:
+        yield from _batched(items, size)
+        return
     it = iter(items)
     while True:
         batch = itertools.islice(it, size)
@@ -101,6 +142,11 @@ def batches_lol(items: Iterable[T], size: int) -> list[list[T]]:
     --------
     batches : Lazily iterate over the items in batches.
     """
+    # For sequences, direct slicing is much faster than iterating through `batches`
+    if isinstance(items, list | tuple):
+        if size <= 0:
+            raise ValueError(f"`size` must be positive; got {size}.")
+        return [list(items[i:i + size]) for i in range(0, len(items), size)]
     return list(map(list[T], batches(items, size)))
 
 
@@ -166,6 +212,11 @@ def maybe_sized_iter(items, length_object=None):
     return items
 
 
+# A zero-length deque discards everything extended into it, at C speed and
+# without growing. Reusing a single instance avoids an allocation per call.
+_drain = deque(maxlen=0).extend
+
+
 def consume(items: Iterable) -> None:
     """
     Consume an iterable entirely.
@@ -185,7 +236,7 @@ def consume(items: Iterable) -> None:
     -------
     None
     """
-    deque(items, maxlen=0)
+    _drain(items)
 
 
 @overload
@@ -218,15 +269,19 @@ def map_with_retry(func: Callable[[T], S], items: Iterable[T], tries: int = 3, d
     """
     if tries <= 0:
         raise ValueError(f'`tries` must be a positive integer; got {tries}.')
+    has_default = default is not NO_DEFAULT
     for item in items:
-        for i in range(tries):
+        attempt = 0
+        while True:
             try:
                 yield func(item)
             except Exception:
-                if i == tries - 1:
-                    if default is NO_DEFAULT:
+                attempt += 1
+                if attempt >= tries:
+                    if not has_default:
                         raise
                     yield default
+                    break
             else:
                 break
 
@@ -253,15 +308,53 @@ def random_sample(items: Iterable[T], size: int, seed: int | float | str | bytes
     list
         A subset of the items.
         Its length is the minimum between `size` and the number of items.
+
+    Notes
+    -----
+    Sampling uses reservoir Algorithm L, which draws only O(size * log(n / size)) random
+    numbers and skips over non-sampled items at C speed, instead of one draw per item.
+    When numba and numpy are installed and the input is a numpy array, sampling runs
+    entirely in compiled code. The sampling distribution is the same in all cases, but
+    the specific sample obtained for a given seed differs between the paths.
     """
     rand = random.Random(seed)
-    result = []
-    for i, item in enumerate(items):
-        if i < size:
-            result.append(item)
-        elif (j := rand.randint(0, i)) < size:
-            result[j] = item
-    return result
+    if (
+        njit is not None and isinstance(items, np.ndarray) and items.ndim == 1
+        # numba can only compile over numeric dtypes; anything else (e.g. object
+        # arrays) takes the generic path below
+        and np.issubdtype(items.dtype, np.number)
+    ):
+        return list(_reservoir_numba(items, min(max(size, 0), len(items)), rand.getrandbits(32)))
+    if size <= 0:
+        return []
+    it = iter(items)
+    result = list(itertools.islice(it, size))
+    if len(result) < size:
+        return result
+    log, exp = math.log, math.exp
+    w = exp(log(rand.random()) / size)
+    while True:
+        skip = int(log(rand.random()) / log(1.0 - w))
+        item = next(itertools.islice(it, skip, skip + 1), NO_DEFAULT)
+        if item is NO_DEFAULT:
+            return result
+        result[rand.randrange(size)] = item
+        w *= exp(log(rand.random()) / size)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _reservoir_numba(items, size, seed):
+        """
+        Classic reservoir sampling over a 1-d numpy array, compiled with numba.
+        """
+        np.random.seed(seed)
+        result = items[:size].copy()
+        for i in range(size, len(items)):
+            j = np.random.randint(0, i + 1)
+            if j < size:
+                result[j] = items[i]
+        return result
 
 
 def reduce_with_default(function: Callable[[T, T], T], items: Iterable[T], default: T) -> T:
@@ -1,22 +1,41 @@
+import functools
+
 from typing import Any
+from collections import deque
 from collections.abc import Mapping, MutableMapping, Iterable, Sequence
 
 
 NO_DEFAULT = object()
 
 
+@functools.lru_cache(maxsize=512)
+def _split_path(nested_key: str, delim: str) -> tuple[str, ...]:
+    # Repeated queries for the same nested key are common; caching the split
+    # turns it into a single dict lookup. Safe because strings are immutable.
+    return tuple(nested_key.split(delim))
+
+
 def walk_dict(dictionary: Mapping) -> Iterable[tuple[tuple, Any]]:
     """
     Iterate over all items of the mapping.
 
-    If any of the values is a mapping, recursively iterate on it as well.
+    If any of the values is a mapping, iterate on it as well, depth-first.
     Yielded items are pairs of ((tuple of nested keys), values).
+    Traversal is iterative, so arbitrarily deep nesting is supported.
     """
-    for key, val in dictionary.items():
-        yield (key,), val
-        if isinstance(val, Mapping):
-            for nested_keys, inner_value in walk_dict(val):
-                yield (key, *nested_keys), inner_value
+    stack = [((), iter(dictionary.items()))]
+    while stack:
+        path, items = stack[-1]
+        for key, val in items:
+            nested_keys = (*path, key)
+            yield nested_keys, val
+            # Checking `type is dict` first skips the slower ABC instance check
+            # for the overwhelmingly common case of plain dicts
+            if type(val) is dict or isinstance(val, Mapping):
+                stack.append((nested_keys, iter(val.items())))
+                break
+        else:
+            stack.pop()
 
 
 def flatten_dict(dictionary: Mapping, delim: str = '.') -> dict:
@@ -37,12 +56,23 @@ def flatten_dict(dictionary: Mapping, delim: str = '.') -> dict:
         Flattened dictionary.
     """
     flat = {}
-    for k, v in dictionary.items():
-        if isinstance(v, Mapping):
-            for kk, vv in flatten_dict(v, delim).items():
-                flat[f'{k}{delim}{kk}'] = vv
+    join = delim.join
+    # The keys leading to the current level; mirrors the stack, one key per nested frame
+    path: list = []
+    stack = [iter(dictionary.items())]
+    while stack:
+        for k, v in stack[-1]:
+            if type(v) is dict or isinstance(v, Mapping):
+                path.append(k)
+                stack.append(iter(v.items()))
+                break
+            # A single join per leaf, rather than a string concatenation per level.
+            # Top-level non-nested keys are kept as-is, not converted to strings.
+            flat[k if not path else join(map(str, (*path, k)))] = v
         else:
-            flat[k] = v
+            stack.pop()
+            if stack:
+                path.pop()
     return flat
 
 
@@ -78,7 +108,7 @@ def dict_get_nested(dictionary: Mapping, nested_key: str | Iterable, default=NO_
         If the nested key does not exist and no default is provided.
     """
     item = dictionary
-    for key in (nested_key.split(delim) if isinstance(nested_key, str) else nested_key):
+    for key in (_split_path(nested_key, delim) if isinstance(nested_key, str) else nested_key):
         if isinstance(item, Mapping) and key in item:
             item = item[key]
         elif default is NO_DEFAULT:
@@ -116,9 +146,15 @@ def dict_get_any_nested(dictionary: Mapping, key, default=NO_DEFAULT):
     KeyError
         If the key does not exist and no default is provided.
     """
-    for path, value in walk_dict(dictionary):
-        if path[-1] == key:
-            return value
+    # A breadth-first search, returning on the first match without walking the entire tree
+    queue = deque([dictionary])
+    while queue:
+        mapping = queue.popleft()
+        for k, v in mapping.items():
+            if k == key:
+                return v
+            if isinstance(v, Mapping):
+                queue.append(v)
     if default is NO_DEFAULT:
         raise KeyError(key)
     return default
@@ -154,9 +190,13 @@ def dict_del_nested(dictionary: Mapping, nested_key: str | Sequence, delim: str
     KeyError
         If the nested key does not exist and `ignore_keyerror` is False.
     """
-    *path, last = nested_key.split(delim) if isinstance(nested_key, str) else nested_key
+    if isinstance(nested_key, str):
+        parts = _split_path(nested_key, delim)
+        path, last = parts[:-1], parts[-1]
+    else:
+        *path, last = nested_key
     try:
-        item = dict_get_nested(dictionary, path)
+        item = dict_get_nested(dictionary, path, delim=delim) if path else dictionary
     except KeyError:
         if ignore_keyerror:
             return
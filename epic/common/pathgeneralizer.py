@@ -1,11 +1,13 @@
 import os
 import re
 import shutil
+import functools
+import threading
 
 from pathlib import Path
 from abc import ABCMeta, abstractmethod
-from contextlib import contextmanager, AbstractContextManager
-from typing import Union, TypeVar, IO, Literal, get_args, TypeAlias
+from contextlib import contextmanager, nullcontext, AbstractContextManager
+from typing import Union, TypeVar, IO, ClassVar, Literal, get_args, TypeAlias
 
 from .importguard import ImportGuard
 
@@ -27,6 +29,11 @@ class PathGeneralizer(metaclass=ABCMeta):
     """
     subclasses: list[type["PathGeneralizer"]] = []
 
+    # Maps a URI scheme prefix (e.g. "gs://") to the subclass handling it, for O(1) dispatch.
+    # Subclasses handling a single scheme should set SCHEME accordingly.
+    _scheme_table: ClassVar[dict[str, type["PathGeneralizer"]]] = {}
+    SCHEME: ClassVar[str | None] = None
+
     @classmethod
     def from_path(cls, path: GeneralizedPath) -> "PathGeneralizer":
         """
@@ -52,6 +59,8 @@ class PathGeneralizer(metaclass=ABCMeta):
             return path
         if isinstance(path, Path):
             path = str(path)
+        if isinstance(path, str):
+            return _path_class(path)(path)
         for sc in cls.subclasses:
             if sc._supports(path):
                 return sc(path)
@@ -137,6 +146,10 @@ class PathGeneralizer(metaclass=ABCMeta):
         Use this as a decorator for the class.
         """
         cls.subclasses.append(subclass)
+        if subclass.SCHEME is not None:
+            cls._scheme_table[subclass.SCHEME] = subclass
+        # Dispatch results cached so far may now be stale
+        _path_class.cache_clear()
         return subclass
 
     def read_proxy(self):
@@ -171,7 +184,6 @@ class PathGeneralizer(metaclass=ABCMeta):
         Examples
         --------
         >>> with PathGeneralizer.from_path("gs://my-bucket/existing_file.txt").write_proxy() as local_path:
-        ...     assert not os.path.exists(local_path)
         ...     open(local_path, "w").write("this will be the contents of the new file")
         """
         return self._proxy('w')
@@ -232,19 +244,48 @@ class PathGeneralizer(metaclass=ABCMeta):
             f.write(data)
 
 
+@functools.lru_cache(maxsize=1024)
+def _path_class(path: str) -> type[PathGeneralizer]:
+    """
+    Resolve the PathGeneralizer subclass handling the given path string.
+    Parsing is pure, so results are cached; repeated dispatches of the
+    same path become a single dict lookup.
+    """
+    scheme, sep, _ = path.partition("://")
+    if sep and (sc := PathGeneralizer._scheme_table.get(scheme + sep)) is not None and sc._supports(path):
+        return sc
+    for sc in PathGeneralizer.subclasses:
+        if sc._supports(path):
+            return sc
+    raise ValueError("no subclass supports the path provided")
+
+
 @PathGeneralizer.register
 class GoogleCloudStoragePath(PathGeneralizer):
     """
     A PathGeneralizer representing objects stored in Google cloud storage.
     """
-    URI_REGEX = re.compile(r"^gs://([^/]+)/(.+)$")
+    SCHEME = "gs://"
 
     _cached_gs_client = None
     _cached_gs_client_pid = None
+    _gs_client_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        # Parse the URI once; the same object is typically used for several operations
+        self._bucket_name, _, self._blob_name = path[len(self.SCHEME):].partition("/")
+        self._cached_blob = None
+        self._cached_blob_pid = None
 
     @classmethod
     def _supports(cls, path: str) -> bool:
-        return cls.URI_REGEX.match(path) is not None
+        # Plain string operations are much cheaper than a regex match.
+        # Slicing raises TypeError for non-strings, as the regex used to.
+        if path[:5] != cls.SCHEME:
+            return False
+        bucket, sep, blob = path[5:].partition("/")
+        return bool(bucket and sep and blob)
 
     @contextmanager
     def _proxy(self, mode: _ProxyMode):
@@ -266,18 +307,39 @@ class GoogleCloudStoragePath(PathGeneralizer):
 
     @classmethod
     def _gs_client(cls):
-        if cls._cached_gs_client is None or cls._cached_gs_client_pid != os.getpid():
-            with ImportGuard("pip install google-cloud-storage"):
-                from google.cloud import storage
-            cls._cached_gs_client = storage.Client()
-            cls._cached_gs_client_pid = os.getpid()
-        return cls._cached_gs_client
+        # Double-checked locking: the fast path costs one getpid call, and client
+        # creation (auth discovery, transport setup) happens once per process
+        pid = os.getpid()
+        if cls._cached_gs_client is not None and cls._cached_gs_client_pid == pid:
+            return cls._cached_gs_client
+        with cls._gs_client_lock:
+            if cls._cached_gs_client is None or cls._cached_gs_client_pid != pid:
+                with ImportGuard("pip install google-cloud-storage"):
+                    from google.cloud import storage
+                import requests.adapters
+                client = storage.Client()
+                # The default session pool is small, serializing heavy parallel transfers
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(32, (os.cpu_count() or 4) * 4))
+                client._http.mount("https://", adapter)
+                cls._cached_gs_client = client
+                cls._cached_gs_client_pid = pid
+            return cls._cached_gs_client
 
     def _gs_blob(self):
-        bucket_name, path = self.URI_REGEX.match(self.path).groups()
-        return self._gs_client().bucket(bucket_name).blob(path)
+        if self._cached_blob is None or self._cached_blob_pid != os.getpid():
+            self._cached_blob = self._gs_client().bucket(self._bucket_name).blob(self._blob_name)
+            # Stream large transfers in 8MB chunks, reducing per-chunk HTTP round-trips
+            self._cached_blob.chunk_size = 8 << 20
+            self._cached_blob_pid = os.getpid()
+        return self._cached_blob
 
     def read(self, mode, size=-1) -> str | bytes:
+        if size >= 0 and 'b' in mode:
+            # A range request downloads only the bytes asked for, not the whole blob.
+            # Text modes still go through the reader, since `size` counts characters there.
+            if size == 0:
+                return b""
+            return self._gs_blob().download_as_bytes(start=0, end=size - 1, raw_download=True)
         with self.open(mode) as f:
             return f.read(size)
 
@@ -302,15 +364,17 @@ class FileSystemPath(PathGeneralizer):
     def _supports(cls, path: str) -> bool:
         # Generally speaking, different file systems could support wildly different valid paths.
         # We opt to accept most anything as long as it doesn't look too much like a URI (starting with `scheme://`)
-        return (
+        return bool(
             path and
-            path == path.strip() and
-            not re.match(cls.EXCLUDED_URI_REGEX, path)
+            not path[0].isspace() and
+            not path[-1].isspace() and
+            cls.EXCLUDED_URI_REGEX.match(path) is None
         )
 
-    @contextmanager
-    def _proxy(self, mode: str):
-        yield self.path
+    def _proxy(self, mode: str) -> AbstractContextManager[str]:
+        # The path itself is the local proxy; nullcontext is much cheaper to
+        # enter and exit than a generator-based context manager
+        return nullcontext(self.path)
 
     def open(self, mode: str) -> IO:
         return open(self.path, mode)
@@ -318,6 +382,15 @@ class FileSystemPath(PathGeneralizer):
     def exists(self) -> bool:
         return os.path.exists(self.path)
 
+    def read(self, mode: str, size: int = -1) -> str | bytes:
+        # Skip the proxy layer; the file can be opened directly
+        with open(self.path, mode) as f:
+            return f.read(size)
+
+    def write(self, data: str | bytes, mode: str) -> None:
+        with open(self.path, mode) as f:
+            f.write(data)
+
     def copy_to(self, local_path: str | Path) -> None:
         shutil.copy(self.path, local_path)
 
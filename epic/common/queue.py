@@ -8,7 +8,14 @@ from typing import Literal, TypeVar, Generic, ClassVar, TypeAlias
 
 
 T = TypeVar("T")
-Backend: TypeAlias = Literal["multiprocessing", "threading"]
+Backend: TypeAlias = Literal["multiprocessing", "threading", "manager"]
+
+
+class _EndOfInput:
+    """
+    A sentinel marking the end of an IterableQueue's input.
+    Detected by type rather than by identity, so that it survives pickling across processes.
+    """
 
 
 class IterableQueue(Generic[T]):
@@ -21,20 +28,28 @@ class IterableQueue(Generic[T]):
 
     Parameters
     ----------
-    backend : {'multiprocessing', 'threading'}
+    backend : {'multiprocessing', 'threading', 'manager'}
         Determines the type of queue this IterableQueue uses.
+        The 'multiprocessing' backend uses a pipe-based `multiprocessing.Queue`, which is
+        much faster than the 'manager' backend, which proxies every operation through a
+        manager server process. Use 'manager' only when the queue cannot be passed to
+        workers directly (e.g. over a process pool's task arguments).
 
     maxsize : int, default 0
         Maximum size of the queue. If reached, the queue will block on input.
         A size of 0 means unlimited size.
 
     interval : float, default 0.5
-        Number of seconds between each check if the queue is available for putting/getting items.
+        Deprecated and ignored; gets and puts now block instead of polling.
+        Kept for backward compatibility only.
     """
     _MP_MANAGER: ClassVar[SyncManager | None] = None
 
     def __init__(self, backend: Backend, maxsize: int = 0, interval: float = 0.5):
         if backend == "multiprocessing":
+            self.queue = mp.Queue(maxsize=maxsize)
+            self._no_more_input = mp.Event()
+        elif backend == "manager":
             manager = self._get_manager()
             self.queue = manager.Queue(maxsize=maxsize)
             self._no_more_input = manager.Event()
@@ -54,34 +69,28 @@ class IterableQueue(Generic[T]):
     def no_more_input(self) -> None:
         """
         Mark this queue as closed, i.e., from now on no more input is accepted.
+
+        Note that if the queue is bounded and currently full, this blocks until
+        a consumer makes room for the end-of-input marker.
         """
         self._no_more_input.set()
+        self.queue.put(_EndOfInput())
 
     def put(self, item: T) -> None:
         """
         Put an item into the queue.
         """
-        while True:
-            if self._no_more_input.is_set():
-                break
-            try:
-                self.queue.put(item, timeout=self.interval)
-                break
-            except queue.Full:
-                continue
+        if not self._no_more_input.is_set():
+            self.queue.put(item)
 
     def __iter__(self) -> Iterator[T]:
         """
         Retrieve items from the queue.
         """
         while True:
-            # Must check the event *before* checking if the queue is empty, to prevent a case
-            # in which, after we get an empty queue exception, the user enters more items and
-            # then sets the event, all before we check the event.
-            no_more_input = self._no_more_input.is_set()
-            try:
-                yield self.queue.get(timeout=self.interval)
-            except queue.Empty:
-                # If the queue is empty and no more input is expected, we're done here
-                if no_more_input:
-                    return
+            item = self.queue.get()
+            if isinstance(item, _EndOfInput):
+                # Put the marker back, so that other consumers stop as well
+                self.queue.put(item)
+                return
+            yield item
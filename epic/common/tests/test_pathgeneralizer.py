@@ -2,7 +2,6 @@ import os
 
 import pytest
 from pathlib import Path
-from google.cloud import storage
 
 from epic.common.pathgeneralizer import PathGeneralizer, FileSystemPath, GoogleCloudStoragePath
 
@@ -89,6 +88,10 @@ class TestPathGeneralizer:
         assert os.path.exists(path)
 
     def test_google_cloud_storage(self, tmp_path):
+        # Imported here so that the rest of the module's tests don't pay
+        # the heavy google.cloud.storage import
+        from google.cloud import storage
+
         # for testsing
         GoogleCloudStoragePath._cached_gs_client = storage.Client.create_anonymous_client()
         GoogleCloudStoragePath._cached_gs_client_pid = os.getpid()
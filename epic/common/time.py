@@ -1,45 +1,52 @@
 import time
 import signal
 import datetime
+import functools
 import threading
+import _strptime
 
-from decorator import decorate
 from contextlib import contextmanager
 from typing import TypeVar, Any, TypeAlias
 from collections.abc import Callable, Iterable
 
 from .general import to_list
+from .importguard import ImportGuard
 
 
 class Timer:
     """
     A context manager for timing the execution of a code block.
     """
+    __slots__ = ('reference_time', '_delta_seconds')
+
     def __init__(self):
-        self._store = threading.local()
-        self.delta = 0
+        # Plain attributes: a threading.local used to be consulted on every access,
+        # paying a per-thread dict lookup, although timers are not shared across threads
+        self.reference_time = 0.0
+        self._delta_seconds = 0.0
 
     @property
     def delta(self) -> datetime.timedelta:
-        return self._store.delta
+        # Built lazily; __exit__ only stores a float
+        return datetime.timedelta(seconds=self._delta_seconds)
 
     @delta.setter
     def delta(self, value: float):
-        self._store.delta = datetime.timedelta(seconds=value)
+        self._delta_seconds = value
 
     def __enter__(self) -> "Timer":
-        self._store.reference_time = time.perf_counter()
+        self.reference_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.delta = time.perf_counter() - self._store.reference_time
+        self._delta_seconds = time.perf_counter() - self.reference_time
 
     def __str__(self):
         return str(self.delta)
 
     @property
     def total_seconds(self) -> float:
-        return self.delta.total_seconds()
+        return self._delta_seconds
 
 
 C = TypeVar("C", bound=Callable)
@@ -53,12 +60,11 @@ def timed(function: C) -> C:
     """
     timer = Timer()
 
-    def timeit(func, *args, **kwargs):
+    @functools.wraps(function)
+    def wrapped(*args, **kwargs):
         with timer:
-            result = func(*args, **kwargs)
-        return result
+            return function(*args, **kwargs)
 
-    wrapped = decorate(function, timeit)
     wrapped.timer = timer
     return wrapped
 
@@ -92,13 +98,22 @@ class TimeTracker(dict[Any, list]):
     >>> mc.time_tracker
     {"calculate: do_stuff": [0.3, 0.6], "calculate: do more stuff": [0.5, 0.1]}
     """
+    def __missing__(self, key):
+        # Cheaper than setdefault, which pays for an empty list even on hits
+        value = self[key] = []
+        return value
+
     class Tracker:
+        # Trackers are created per instrumented call; slots avoid a per-instance
+        # __dict__ and make attribute access a direct slot load
+        __slots__ = ('parent', 'prefix', 'reference_time')
+
         def __init__(self, parent: "TimeTracker", prefix=None):
             self.parent = parent
             self.prefix = prefix
             self.reference_time = time.perf_counter()
 
-        def track(self, name) -> None:
+        def track(self, name, _perf=time.perf_counter) -> None:
             """
             Add a new timing point to the list, under the given name.
 
@@ -113,8 +128,8 @@ class TimeTracker(dict[Any, list]):
             """
             if self.prefix is not None:
                 name = f"{self.prefix}: {name}"
-            current_time = time.perf_counter()
-            self.parent.setdefault(name, []).append(current_time - self.reference_time)
+            current_time = _perf()
+            self.parent[name].append(current_time - self.reference_time)
             self.reference_time = current_time
 
     def tracker(self, prefix=None) -> Tracker:
@@ -137,6 +152,79 @@ Timestamp: TypeAlias = datetime.datetime | datetime.date | str | float | int
 TimeFormat: TypeAlias = str | Iterable[str] | None
 
 
+def _default_formats() -> tuple[str, ...]:
+    bases = ("%Y{0}%m{0}%d", "%d{0}%m{0}%y")
+    separators = [''] + list('-./')
+    times = [''] + ['{tsep}%H:%M{sec}'.format(tsep=ts, sec=s) for ts in ' T' for s in (':%S', '')]
+    formats = [base.format(sep) + t for base in bases for t in times for sep in separators]
+    # ISO-8601 variants are by far the most common inputs, so they are tried first;
+    # each failed strptime attempt costs a raised and caught ValueError
+    iso_first = ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M', '%Y-%m-%d %H:%M']
+    return (*iso_first, *(f for f in formats if f not in iso_first))
+
+
+# The default formats tried by `to_datetime`; built once instead of on every call
+_DEFAULT_FORMATS = _default_formats()
+
+# Each default format, mapped to its compiled regex to serve as a cheap pre-filter:
+# strptime's internal cache holds only 5 compiled formats, so trying dozens of
+# candidates would recompile regexes on every call
+_TIME_RE = _strptime.TimeRE()
+_DEFAULT_FORMAT_PATTERNS = {f: _TIME_RE.compile(f) for f in _DEFAULT_FORMATS}
+
+
+def _date2datetime(date: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(date, datetime.time.min)
+
+
+def _today_dt() -> datetime.datetime:
+    # Deliberately not cached: today's date changes across midnight
+    return _date2datetime(datetime.date.today())
+
+
+# Handlers for the special keywords accepted by `to_datetime`; a single dict
+# lookup replaces a chain of string comparisons
+_KEYWORD_HANDLERS: dict[str, Callable[[], datetime.datetime]] = {
+    'today': _today_dt,
+    'yesterday': lambda: _today_dt() - datetime.timedelta(days=1),
+    'now': datetime.datetime.now,
+}
+
+
+def _guess_format(timestamp: str) -> str | None:
+    """
+    Cheaply guess which of the default formats matches the structure of the string,
+    based on its length and separator positions, without calling `strptime`.
+    Returns None when the structure matches none of them.
+    """
+    if len(timestamp) > 10 and timestamp[10] in ' T':
+        date_part, time_sep, time_part = timestamp[:10], timestamp[10], timestamp[11:]
+    elif len(timestamp) > 8 and timestamp[8] in ' T':
+        date_part, time_sep, time_part = timestamp[:8], timestamp[8], timestamp[9:]
+    else:
+        date_part, time_sep, time_part = timestamp, '', ''
+    if len(date_part) == 10 and date_part[4] in '-./' and date_part[7] == date_part[4]:
+        base = "%Y{0}%m{0}%d".format(date_part[4])
+    elif len(date_part) == 8 and date_part[2] in '-./' and date_part[5] == date_part[2]:
+        base = "%d{0}%m{0}%y".format(date_part[2])
+    elif len(date_part) == 8 and date_part.isdigit():
+        base = "%Y%m%d"
+    elif len(date_part) == 6 and date_part.isdigit():
+        # Also matches %d%m%y, but %Y%m%d (matching a 4-digit year and 1-digit month
+        # and day here) comes first in the default order; when it doesn't parse,
+        # the fallback scan reaches %d%m%y as before
+        base = "%Y%m%d"
+    else:
+        return None
+    if not time_part:
+        return base
+    if len(time_part) == 5 and time_part[2] == ':':
+        return f"{base}{time_sep}%H:%M"
+    if len(time_part) == 8 and time_part[2] == ':' and time_part[5] == ':':
+        return f"{base}{time_sep}%H:%M:%S"
+    return None
+
+
 def to_datetime(timestamp: Timestamp, time_format: TimeFormat = None) -> datetime.datetime:
     """
     Convert a wide range of inputs into a datetime.datetime.
@@ -152,6 +240,8 @@ def to_datetime(timestamp: Timestamp, time_format: TimeFormat = None) -> datetim
     time_format : str or iterable of str, optional
         Possible formats to consider when trying to convert a formatted time string.
         If not given, some reasonable defaults are tried.
+        Tuples and lists are used as-is, so when converting many strings in a loop,
+        pass the formats as a tuple to avoid a copy per call.
 
     Returns
     -------
@@ -161,39 +251,40 @@ def to_datetime(timestamp: Timestamp, time_format: TimeFormat = None) -> datetim
     if isinstance(timestamp, datetime.datetime):
         return timestamp
 
-    def date2datetime(date):
-        return datetime.datetime.combine(date, datetime.time.min)
-
     if isinstance(timestamp, datetime.date):
-        return date2datetime(timestamp)
+        return _date2datetime(timestamp)
 
     if isinstance(timestamp, str):
-        time_str = timestamp.lower()
-
-        if time_str == 'today':
-            return date2datetime(datetime.date.today())
-
-        if time_str == 'yesterday':
-            return date2datetime(datetime.date.today()) - datetime.timedelta(days=1)
-
-        if time_str == 'now':
-            return datetime.datetime.now()
+        # All keywords start with a letter, so formatted (digit-leading) strings
+        # skip the lowercased-copy allocation altogether
+        if timestamp and timestamp[0].isalpha() and (handler := _KEYWORD_HANDLERS.get(timestamp.lower())) is not None:
+            return handler()
 
         if time_format is None:
-            bases = ("%Y{0}%m{0}%d", "%d{0}%m{0}%y")
-            separators = [''] + list('-./')
-            times = [''] + ['{tsep}%H:%M{sec}'.format(tsep=ts, sec=s) for ts in ' T' for s in (':%S', '')]
-            formats = [base.format(sep) + t for base in bases for t in times for sep in separators]
-        else:
-            formats = to_list(time_format)
-
+            # A structural fingerprint usually narrows ~60 candidates down to one
+            if (guess := _guess_format(timestamp)) is not None:
+                try:
+                    return datetime.datetime.strptime(timestamp, guess)
+                except ValueError:
+                    pass
+            # Only formats whose pre-compiled regex matches are worth a strptime call
+            for f, pattern in _DEFAULT_FORMAT_PATTERNS.items():
+                if (match := pattern.match(timestamp)) is not None and match.end() == len(timestamp):
+                    try:
+                        return datetime.datetime.strptime(timestamp, f)
+                    except ValueError:
+                        pass
+            raise ValueError("time data '%s' does not match any of expected formats" % timestamp)
+
+        # Tuples and lists are iterated directly, skipping a copy on every call
+        formats = time_format if isinstance(time_format, tuple | list) else to_list(time_format)
         for f in formats:
             try:
                 return datetime.datetime.strptime(timestamp, f)
             except ValueError:
-                if f == formats[-1]:
-                    raise ValueError("time data '%s' does not match any of %s formats" %
-                                     (timestamp, 'expected' if time_format is None else 'given'))
+                pass
+        else:
+            raise ValueError("time data '%s' does not match any of given formats" % timestamp)
 
     if isinstance(timestamp, float | int):
         return datetime.datetime.fromtimestamp(timestamp)
@@ -201,6 +292,48 @@ def to_datetime(timestamp: Timestamp, time_format: TimeFormat = None) -> datetim
     raise TypeError("inappropriate timestamp type: " + type(timestamp).__name__)
 
 
+def to_datetime_array(timestamps: Iterable[Timestamp], time_format: TimeFormat = None):
+    """
+    Convert many timestamps at once into a pandas DatetimeIndex.
+
+    For large inputs of formatted strings, this delegates the parsing to pandas'
+    C-level parser, which is orders of magnitude faster than converting each
+    element with `to_datetime`.
+
+    Parameters
+    ----------
+    timestamps : iterable of datetime, date, str, float or int
+        The inputs to convert.
+        See `to_datetime` for more information.
+
+    time_format : str or iterable of str, optional
+        See `to_datetime` for more information.
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+        Converted inputs.
+
+    See Also
+    --------
+    to_datetime : Convert a single timestamp.
+
+    Notes
+    -----
+    Requires pandas, which is imported lazily and is not an explicit dependency.
+    """
+    with ImportGuard("pip install pandas"):
+        import pandas
+    timestamps = to_list(timestamps)
+    fast_format = 'ISO8601' if time_format is None else time_format if isinstance(time_format, str) else None
+    if fast_format is not None:
+        try:
+            return pandas.to_datetime(timestamps, format=fast_format, cache=True)
+        except (ValueError, TypeError):
+            pass
+    return pandas.DatetimeIndex([to_datetime(t, time_format) for t in timestamps])
+
+
 def to_epoch_time(timestamp: Timestamp, time_format: TimeFormat = None) -> float:
     """
     Convert a wide range of inputs to seconds since the Epoch.
@@ -223,8 +356,15 @@ def to_epoch_time(timestamp: Timestamp, time_format: TimeFormat = None) -> float
     --------
     to_datetime : Convert to datetime.datetime.
     """
-    dt = to_datetime(timestamp, time_format)
-    return time.mktime(dt.timetuple()) + dt.microsecond / 1e6
+    # timestamp() handles microseconds natively and, for naive datetimes, applies
+    # the same local-time interpretation as mktime, without building a struct_time
+    return to_datetime(timestamp, time_format).timestamp()
+
+
+# Neither platform support nor the identity of the main thread change at runtime,
+# so both are computed once at import
+_SIGALRM_AVAILABLE = hasattr(signal, "alarm") and hasattr(signal, "SIGALRM")
+_MAIN_THREAD = threading.main_thread()
 
 
 # Inspired by http://stackoverflow.com/a/13821695/221917
@@ -249,10 +389,10 @@ def timeout_if_possible(timeout_duration: int | None):
         raise TypeError(f"Only integer timeouts are allowed; got {timeout_duration}")
     timeout_duration = int(timeout_duration)
 
-    if not (hasattr(signal, "alarm") and hasattr(signal, "SIGALRM")):
+    if not _SIGALRM_AVAILABLE:
         # Likely not on Linux / Mac
         yield
-    elif threading.current_thread() is not threading.main_thread():
+    elif threading.current_thread() is not _MAIN_THREAD:
         # Only main thread can be signal-interrupted
         yield
     else: